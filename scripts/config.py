@@ -4,12 +4,19 @@ Configuration file for AppBinHub automation scripts
 Contains settings and repository lists based on research
 """
 
+import functools
+import json
 import os
+import re
+import time
 from pathlib import Path
+from types import MappingProxyType
+from urllib.parse import urlsplit
 
 # GitHub API Configuration
 GITHUB_API_BASE_URL = "https://api.github.com"
 GITHUB_TOKEN_ENV_VAR = "GITHUB_TOKEN"
+GITHUB_TOKENS_ENV_VAR = "GITHUB_TOKENS"
 
 # Rate limiting settings (based on GitHub API research)
 GITHUB_API_RATE_LIMIT_THRESHOLD = 100  # Minimum requests before stopping
@@ -27,13 +34,13 @@ CATEGORIES_JSON = WEBSITE_DATA_DIR / "categories.json"
 CHANGELOG_JSON = WEBSITE_DATA_DIR / "changelog.json"
 
 # AppImage repositories to monitor (based on research)
-APPIMAGE_REPOSITORIES = [
-    # Start with an empty list - add only verified working repositories
+APPIMAGE_REPOSITORIES = (
+    # Start with an empty tuple - add only verified working repositories
     # Example format: "owner/repo"
-]
+)
 
 # Architecture mapping - shared between monitor and converter
-ARCHITECTURE_MAPPING = {
+ARCHITECTURE_MAPPING = MappingProxyType({
     # Common architecture names to standard names
     'x86_64': 'x86_64',
     'amd64': 'x86_64', 
@@ -48,35 +55,35 @@ ARCHITECTURE_MAPPING = {
     'aarch64': 'aarch64',
     'arm64': 'aarch64',
     # Add more as needed
-}
+})
 
 # Package format preferences by architecture
-PACKAGE_FORMAT_PREFERENCES = {
-    'x86_64': ['deb', 'rpm', 'tar.gz'],
-    'i386': ['deb', 'rpm', 'tar.gz'],  
-    'armv7l': ['deb', 'tar.gz'],  # RPM less common on ARM
-    'aarch64': ['deb', 'rpm', 'tar.gz'],
-}
+PACKAGE_FORMAT_PREFERENCES = MappingProxyType({
+    'x86_64': ('deb', 'rpm', 'tar.gz'),
+    'i386': ('deb', 'rpm', 'tar.gz'),
+    'armv7l': ('deb', 'tar.gz'),  # RPM less common on ARM
+    'aarch64': ('deb', 'rpm', 'tar.gz'),
+})
 
 # Debian architecture mapping for DEB packages
-DEBIAN_ARCH_MAPPING = {
+DEBIAN_ARCH_MAPPING = MappingProxyType({
     'x86_64': 'amd64',
     'i386': 'i386',
     'armv7l': 'armhf',
     'aarch64': 'arm64',
-}
+})
 
 # RPM architecture mapping for RPM packages
-RPM_ARCH_MAPPING = {
+RPM_ARCH_MAPPING = MappingProxyType({
     'x86_64': 'x86_64',
     'i386': 'i386',
     'armv7l': 'armv7hl',
     'aarch64': 'aarch64',
-}
+})
 
 # Direct API endpoints for applications that don't use GitHub releases
 # Now supports dynamic architecture detection
-DIRECT_API_ENDPOINTS = {
+DIRECT_API_ENDPOINTS = MappingProxyType({
     "cursor": {
         "name": "Cursor AI Editor",
         "category": "development",
@@ -100,17 +107,17 @@ DIRECT_API_ENDPOINTS = {
             }
         }
     }
-}
+})
 
 # Additional repositories that commonly host AppImages
-COMMON_APPIMAGE_HOSTS = [
+COMMON_APPIMAGE_HOSTS = (
     # These are patterns/organizations known to host AppImages
     "probonopd",  # AppImage creator's repositories
     "ivan-hc",    # Known AppImage packager
-]
+)
 
 # Conversion tool settings (based on research)
-CONVERSION_TOOLS = {
+CONVERSION_TOOLS = MappingProxyType({
     "unsquashfs": {
         "command": "unsquashfs",
         "install_method": "apt",  # via squashfs-tools package
@@ -132,7 +139,7 @@ CONVERSION_TOOLS = {
         "enabled": True,
         "optional": True  # Optional since not all distros support RPM
     }
-}
+})
 
 # AppImage extraction settings
 APPIMAGE_EXTRACTION = {
@@ -151,7 +158,7 @@ DESKTOP_FILE_SETTINGS = {
 }
 
 # Category mapping (based on FreeDesktop.org specification)
-CATEGORY_MAPPING = {
+CATEGORY_MAPPING = MappingProxyType({
     # Main categories from FreeDesktop.org
     "AudioVideo": "media",
     "Audio": "media",
@@ -174,7 +181,7 @@ CATEGORY_MAPPING = {
     
     # Default fallback
     "": "other"
-}
+})
 
 # File size limits (based on GitHub Pages constraints)
 MAX_JSON_FILE_SIZE = 1024 * 1024  # 1MB
@@ -192,9 +199,6 @@ LOGGING_CONFIG = {
     "backup_count": 5
 }
 
-# Ensure logs directory exists
-LOGS_DIR.mkdir(parents=True, exist_ok=True)
-
 # Network settings
 NETWORK_SETTINGS = {
     "user_agent": "AppBinHub/1.0 (https://github.com/appbinhub/appbinhub)",
@@ -205,106 +209,166 @@ NETWORK_SETTINGS = {
 }
 
 # Validation settings
-VALIDATION_SETTINGS = {
+VALIDATION_SETTINGS = MappingProxyType({
     "min_appimage_size": 1024 * 1024,  # 1MB minimum
     "max_appimage_size": 500 * 1024 * 1024,  # 500MB maximum
-    "required_appimage_extensions": [".AppImage", ".appimage"],
+    "required_appimage_extensions": (".AppImage", ".appimage"),
     "validate_checksums": True,
     "validate_desktop_files": True
-}
+})
 
+@functools.lru_cache(maxsize=1)
 def get_github_token():
-    """Get GitHub token from environment variable"""
+    """Get GitHub token from environment variable (cached after first read)"""
     token = os.environ.get(GITHUB_TOKEN_ENV_VAR)
     if not token:
         raise ValueError(f"{GITHUB_TOKEN_ENV_VAR} environment variable is required")
     return token
 
+@functools.lru_cache(maxsize=1)
+def get_github_tokens():
+    """Get all configured GitHub tokens as a tuple
+
+    GITHUB_TOKENS may list several comma-separated tokens; rotating
+    across them multiplies the hourly API budget. Falls back to the
+    single GITHUB_TOKEN.
+    """
+    tokens = os.environ.get(GITHUB_TOKENS_ENV_VAR, '')
+    parsed = tuple(t.strip() for t in tokens.split(',') if t.strip())
+    if parsed:
+        return parsed
+    return (get_github_token(),)
+
+# Set once the directories have been created in this process, so
+# defensive ensure_directories() calls from multiple entry points don't
+# repeat the mkdir syscalls
+_directories_ready = False
+
 def ensure_directories():
-    """Ensure all required directories exist"""
+    """Ensure all required directories exist (no-op after first call)"""
+    global _directories_ready
+    if _directories_ready:
+        return
+
     directories = [
         WEBSITE_DATA_DIR,
         CONVERTED_PACKAGES_DIR,
-        LOG_DIR
+        LOG_DIR,
+        LOGS_DIR
     ]
-    
+
     for directory in directories:
         directory.mkdir(parents=True, exist_ok=True)
 
+    _directories_ready = True
+
 def get_conversion_tool_config(tool_name):
     """Get configuration for a specific conversion tool"""
     return CONVERSION_TOOLS.get(tool_name, {})
 
+# Precomputed lookup structures for map_desktop_category.
+# Compound keys are sorted longest-first so more specific categories
+# (e.g. "WebDevelopment") win over their substrings (e.g. "Development").
+_CATEGORY_COMPOUND_KEYS = sorted(
+    ((key, value) for key, value in CATEGORY_MAPPING.items() if key),
+    key=lambda item: -len(item[0])
+)
+
+@functools.lru_cache(maxsize=1024)
 def map_desktop_category(desktop_category):
     """Map desktop file category to AppBinHub category"""
     if not desktop_category:
         return "other"
-    
+
     # Try exact match first
     if desktop_category in CATEGORY_MAPPING:
         return CATEGORY_MAPPING[desktop_category]
-    
-    # Try partial matches for compound categories
-    for key, value in CATEGORY_MAPPING.items():
-        if key and key in desktop_category:
+
+    # Desktop Categories= values are semicolon-separated tokens;
+    # tokenize once and resolve each token with a hash lookup
+    for token in desktop_category.split(';'):
+        if token in CATEGORY_MAPPING:
+            return CATEGORY_MAPPING[token]
+
+    # Fall back to compound-key matching (longest key first)
+    for key, value in _CATEGORY_COMPOUND_KEYS:
+        if key in desktop_category:
             return value
-    
+
     return "other"
 
+# Case-folded suffix tuple so validation is a single C-level endswith
+# instead of a Python-level substring scan
+_APPIMAGE_SUFFIXES = tuple(
+    ext.lower() for ext in VALIDATION_SETTINGS["required_appimage_extensions"]
+)
+
 def is_valid_appimage_url(url):
     """Check if URL appears to be a valid AppImage download"""
     if not url:
         return False
-    
-    url_lower = url.lower()
-    return any(ext in url_lower for ext in VALIDATION_SETTINGS["required_appimage_extensions"])
 
+    # Check the path component only, so URLs that merely mention
+    # .appimage in a query parameter or fragment are rejected
+    path = urlsplit(url).path
+    return path.lower().endswith(_APPIMAGE_SUFFIXES)
+
+# Single compiled pattern for architecture detection - one C-level scan
+# replaces the per-call chains of substring tests. Longer tokens come
+# first so e.g. 'arm64' wins over 'arm'.
+_ARCH_PATTERN = re.compile(
+    r'(x86_64|amd64|x64|intel|aarch64|arm64|armv7l|armhf|i686|i386|32bit|arm)',
+    re.IGNORECASE
+)
+_ARCH_CANONICAL = {
+    'x86_64': 'x86_64', 'amd64': 'x86_64', 'x64': 'x86_64', 'intel': 'x86_64',
+    'i386': 'i386', 'i686': 'i386', '32bit': 'i386',
+    'aarch64': 'aarch64', 'arm64': 'aarch64',
+    'armv7l': 'armv7l', 'armhf': 'armv7l', 'arm': 'armv7l',
+}
+# Tokens ranked by specificity; 'ARM aarch64' must resolve as aarch64
+# even though regex alternation finds the leftmost 'arm' first
+_ARCH_PRIORITY = {token: rank for rank, token in enumerate(_ARCH_CANONICAL)}
+
+def _canonical_arch(text):
+    """Best canonical architecture for text, or None if nothing matches"""
+    tokens = _ARCH_PATTERN.findall(text)
+    if not tokens:
+        return None
+    return _ARCH_CANONICAL[min(tokens, key=_ARCH_PRIORITY.__getitem__)]
+
+@functools.lru_cache(maxsize=4096)
 def normalize_architecture(arch_string):
     """Normalize architecture string to standard format"""
     if not arch_string:
         return 'x86_64'  # Default to x86_64
-    
+
     arch_lower = arch_string.lower()
-    
+
     # Direct mapping first
     if arch_lower in ARCHITECTURE_MAPPING:
         return ARCHITECTURE_MAPPING[arch_lower]
-    
+
     # Pattern matching for complex strings
-    if any(x in arch_lower for x in ['x86_64', 'amd64', 'x64']):
-        return 'x86_64'
-    elif any(x in arch_lower for x in ['i386', 'i686', '32bit']):
-        return 'i386'
-    elif any(x in arch_lower for x in ['aarch64', 'arm64']):
-        return 'aarch64'
-    elif 'arm' in arch_lower:
-        return 'armv7l'
-    
+    arch = _canonical_arch(arch_lower)
+    if arch:
+        return arch
+
     # Default fallback
     return 'x86_64'
 
+@functools.lru_cache(maxsize=4096)
 def detect_architecture_from_url(url):
     """Detect architecture from URL patterns"""
     if not url:
         return 'x86_64'
-    
-    url_lower = url.lower()
-    
-    # Common URL patterns
-    if any(x in url_lower for x in ['x86_64', 'amd64', 'x64', 'intel']):
-        return 'x86_64'
-    elif any(x in url_lower for x in ['i386', 'i686', '32bit']):
-        return 'i386'
-    elif any(x in url_lower for x in ['aarch64', 'arm64']):
-        return 'aarch64'
-    elif 'arm' in url_lower:
-        return 'armv7l'
-    
-    return 'x86_64'
+
+    arch = _canonical_arch(url.lower())
+    return arch or 'x86_64'
 
 def get_package_formats_for_arch(architecture):
     """Get preferred package formats for an architecture"""
-    return PACKAGE_FORMAT_PREFERENCES.get(architecture, ['tar.gz'])
+    return PACKAGE_FORMAT_PREFERENCES.get(architecture, ('tar.gz',))
 
 def get_debian_arch(architecture):
     """Get Debian architecture name for a standard architecture"""
@@ -318,6 +382,48 @@ def generate_version_path(app_id, version):
     """Generate versioned path for converted packages"""
     return CONVERTED_PACKAGES_DIR / app_id / version
 
+def _build_platform_index():
+    """Build a reverse index of platform pattern -> architecture per app
+
+    Keyed by the app's display name - the identifier the monitor carries
+    through its per-app processing (and the architecture cache key).
+    """
+    index = {}
+    for app_config in DIRECT_API_ENDPOINTS.values():
+        patterns = app_config.get('architecture_detection', {}).get('platform_patterns', {})
+        app_index = {}
+        for architecture, platform_names in patterns.items():
+            for platform_name in platform_names:
+                app_index[platform_name] = architecture
+        index[app_config.get('name', '')] = app_index
+    return index
+
+# Built once at import so per-asset classification is a dict hit instead
+# of re-walking the nested DIRECT_API_ENDPOINTS structure
+_PLATFORM_TO_ARCH = _build_platform_index()
+
+def classify_asset_platform(app_name, asset_name):
+    """Classify an asset or platform name to a standard architecture
+
+    Consults the app's own platform patterns first (e.g. 'linux-x64'
+    for Cursor), falling back to generic URL detection, so vendor
+    naming that the generic regex misses still classifies correctly.
+    """
+    app_index = _PLATFORM_TO_ARCH.get(app_name, {})
+
+    # Exact platform pattern match first
+    if asset_name in app_index:
+        return app_index[asset_name]
+
+    # Substring match against the known platform patterns
+    asset_lower = asset_name.lower()
+    for platform_name, architecture in app_index.items():
+        if platform_name in asset_lower:
+            return architecture
+
+    # Fall back to generic URL/filename detection
+    return detect_architecture_from_url(asset_name)
+
 def get_available_architectures_for_app(app_config):
     """Get list of available architectures for an application"""
     # For new config format with detection patterns
@@ -332,43 +438,132 @@ def get_available_architectures_for_app(app_config):
     return ['x86_64']  # Default to x86_64 if no architecture info
 
 def build_api_url_for_architecture(app_config, architecture):
-    """Build API URL for a specific architecture"""
+    """Build list of candidate API URLs for a specific architecture"""
+    urls = []
+
     # Try architecture detection patterns first
     if 'architecture_detection' in app_config:
         base_url = app_config['architecture_detection']['base_api_url']
         patterns = app_config['architecture_detection']['platform_patterns'].get(architecture, [])
-        
-        # Try each platform pattern for this architecture
-        for pattern in patterns:
-            url = f"{base_url}&platform={pattern}"
-            yield url
-    
+        urls.extend(f"{base_url}&platform={pattern}" for pattern in patterns)
+
     # Fallback to known architectures
     if 'known_architectures' in app_config and architecture in app_config['known_architectures']:
-        yield app_config['known_architectures'][architecture]['api_url']
-    
+        urls.append(app_config['known_architectures'][architecture]['api_url'])
+
     # Fallback to old format
     if 'architectures' in app_config and architecture in app_config['architectures']:
-        yield app_config['architectures'][architecture]['api_url']
+        urls.append(app_config['architectures'][architecture]['api_url'])
+
+    return urls
+
+# Shared session for architecture probes so TCP/TLS handshakes are
+# amortized across requests instead of reconnecting per HEAD
+_probe_session = None
+
+def _get_probe_session():
+    global _probe_session
+    if _probe_session is None:
+        import requests
+        _probe_session = requests.Session()
+        _probe_session.headers['User-Agent'] = NETWORK_SETTINGS['user_agent']
+    return _probe_session
+
+def _probe_api_url(api_url):
+    """Check whether an API URL responds with HTTP 200"""
+    try:
+        response = _get_probe_session().head(api_url, timeout=10)
+        return response.status_code == 200
+    except Exception:
+        return False
+
+# Architecture availability changes on the order of days, so probe
+# results are cached on disk and reused across runs within this TTL
+ARCHITECTURE_CACHE_FILE = LOGS_DIR / "architecture_cache.json"
+ARCHITECTURE_CACHE_TTL = 6 * 60 * 60  # 6 hours
+
+def _load_cached_architectures(cache_key):
+    """Load cached architecture probe results if still within TTL"""
+    try:
+        with open(ARCHITECTURE_CACHE_FILE, 'r') as f:
+            cache = json.load(f)
+        entry = cache.get(cache_key)
+        if entry and time.time() - entry['timestamp'] < ARCHITECTURE_CACHE_TTL:
+            return [tuple(item) for item in entry['architectures']]
+    except (OSError, ValueError, KeyError):
+        pass
+    return None
+
+def _store_cached_architectures(cache_key, available_architectures):
+    """Persist architecture probe results for reuse across runs"""
+    try:
+        try:
+            with open(ARCHITECTURE_CACHE_FILE, 'r') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            cache = {}
+        cache[cache_key] = {
+            'timestamp': time.time(),
+            'architectures': [list(item) for item in available_architectures]
+        }
+        ARCHITECTURE_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with open(ARCHITECTURE_CACHE_FILE, 'w') as f:
+            json.dump(cache, f)
+    except OSError:
+        pass  # Cache is best-effort; probing still works without it
+
+def invalidate_architecture_cache(app_name):
+    """Drop the cached probe results for one app
+
+    Called when a cached URL starts answering 4xx, so the next run
+    re-probes instead of retrying a stale endpoint until the TTL lapses.
+    """
+    try:
+        with open(ARCHITECTURE_CACHE_FILE, 'r') as f:
+            cache = json.load(f)
+        if cache.pop(app_name, None) is not None:
+            with open(ARCHITECTURE_CACHE_FILE, 'w') as f:
+                json.dump(cache, f)
+    except (OSError, ValueError):
+        pass  # Cache is best-effort; probing still works without it
 
 def detect_available_architectures_from_api(app_config):
     """Dynamically detect which architectures are actually available from the API"""
-    import requests
-    available_architectures = []
-    
-    potential_architectures = get_available_architectures_for_app(app_config)
-    
-    for architecture in potential_architectures:
-        # Try each possible API URL for this architecture
+    from concurrent.futures import ThreadPoolExecutor
+
+    cache_key = app_config.get('name', '')
+    cached = _load_cached_architectures(cache_key)
+    if cached is not None:
+        return cached
+
+    # Collect candidate URLs in preference order (first pattern wins per arch)
+    candidates = []
+    for architecture in get_available_architectures_for_app(app_config):
         for api_url in build_api_url_for_architecture(app_config, architecture):
-            try:
-                response = requests.head(api_url, timeout=10)
-                if response.status_code == 200:
-                    available_architectures.append((architecture, api_url))
-                    break  # Found working URL for this arch, move to next
-            except:
-                continue  # Try next URL pattern
-    
+            candidates.append((architecture, api_url))
+
+    if not candidates:
+        return []
+
+    # Deduplicate URLs so fallback entries that repeat a detection
+    # pattern are never probed twice
+    unique_urls = list(dict.fromkeys(url for _, url in candidates))
+
+    # Probe all candidates concurrently - this is latency-bound, so wall
+    # time drops from the sum of round trips to roughly the slowest one
+    with ThreadPoolExecutor(max_workers=min(16, len(unique_urls))) as executor:
+        probe_results = dict(zip(unique_urls, executor.map(_probe_api_url, unique_urls)))
+
+    available_architectures = []
+    seen_architectures = set()
+    for architecture, api_url in candidates:
+        if probe_results[api_url] and architecture not in seen_architectures:
+            seen_architectures.add(architecture)
+            available_architectures.append((architecture, api_url))
+
+    if available_architectures:
+        _store_cached_architectures(cache_key, available_architectures)
+
     return available_architectures
 
 def should_create_package_format(architecture, package_format):
@@ -391,11 +586,13 @@ __all__ = [
     'LOGGING_CONFIG',
     'LOGS_DIR',
     'get_github_token',
+    'get_github_tokens',
     'ensure_directories',
     'map_desktop_category',
     'is_valid_appimage_url',
     'normalize_architecture',
     'detect_architecture_from_url',
+    'classify_asset_platform',
     'get_package_formats_for_arch',
     'get_debian_arch',
     'get_rpm_arch',
@@ -403,5 +600,6 @@ __all__ = [
     'get_available_architectures_for_app',
     'build_api_url_for_architecture',
     'detect_available_architectures_from_api',
+    'invalidate_architecture_cache',
     'should_create_package_format'
 ]
\ No newline at end of file
@@ -8,6 +8,11 @@ import json
 import sys
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 def main():
     """List pending apps that need conversion"""
     try:
@@ -16,10 +21,15 @@ def main():
         if not apps_file.exists():
             print('[]')
             return
-        
-        with open(apps_file, 'r') as f:
-            data = json.load(f)
-        
+
+        # orjson parses the catalog in C, several times faster than the
+        # stdlib as applications.json grows
+        if orjson is not None:
+            data = orjson.loads(apps_file.read_bytes())
+        else:
+            with open(apps_file, 'r') as f:
+                data = json.load(f)
+
         # Find apps that need conversion
         pending_apps = []
         for app in data.get('applications', []):
@@ -30,12 +40,15 @@ def main():
                     'architecture': app.get('architecture', 'x86_64'),
                     'url': app['appimage']['url']
                 })
-        
-        print(json.dumps(pending_apps))
-        
+
+        if orjson is not None:
+            print(orjson.dumps(pending_apps).decode())
+        else:
+            print(json.dumps(pending_apps))
+
     except Exception as e:
         print('[]', file=sys.stderr)
         print(f"Error: {e}", file=sys.stderr)
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
@@ -5,12 +5,43 @@ Tests all components of the automation system
 """
 
 import os
+import io
 import sys
 import json
+import functools
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import importlib.util
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import yaml
+    try:
+        from yaml import CSafeLoader as _YamlLoader  # libyaml, ~10x faster
+    except ImportError:
+        from yaml import SafeLoader as _YamlLoader
+except ImportError:
+    yaml = None
+
+@functools.lru_cache(maxsize=None)
+def _load_json(path):
+    """Parse a JSON file once and share the result across tests
+
+    applications.json dominates verification time as the catalog grows;
+    validity and structure tests both need it, so parse it a single
+    time (with orjson's C parser when available).
+    """
+    data = Path(path).read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 def test_file_structure():
     """Test that all required files exist"""
     print("Testing file structure...")
@@ -30,10 +61,21 @@ def test_file_structure():
         'docs/API.md'
     ]
 
-    missing_files = []
+    # One scandir per parent directory answers existence for all
+    # siblings in a single directory read instead of a stat per file
+    by_parent = {}
     for file_path in required_files:
-        if not Path(file_path).exists():
-            missing_files.append(file_path)
+        path = Path(file_path)
+        by_parent.setdefault(path.parent, []).append(path)
+
+    missing_files = []
+    for parent, paths in by_parent.items():
+        try:
+            present = {entry.name for entry in os.scandir(parent)}
+        except OSError:
+            present = set()
+        missing_files.extend(str(path) for path in paths
+                             if path.name not in present)
 
     if missing_files:
         print(f"❌ Missing files: {missing_files}")
@@ -54,10 +96,9 @@ def test_json_validity():
 
     for json_file in json_files:
         try:
-            with open(json_file, 'r') as f:
-                json.load(f)
+            _load_json(json_file)
             print(f"✅ {json_file} is valid JSON")
-        except json.JSONDecodeError as e:
+        except ValueError as e:
             print(f"❌ {json_file} is invalid JSON: {e}")
             return False
         except FileNotFoundError:
@@ -135,15 +176,15 @@ def test_workflow_syntax():
         '.github/workflows/deploy.yml'
     ]
 
+    if yaml is None:
+        print("⚠️  PyYAML not available, skipping YAML validation")
+        return True
+
     for workflow in workflows:
         try:
-            import yaml
             with open(workflow, 'r') as f:
-                yaml.safe_load(f)
+                yaml.load(f, Loader=_YamlLoader)
             print(f"✅ {workflow} has valid YAML syntax")
-        except ImportError:
-            print("⚠️  PyYAML not available, skipping YAML validation")
-            break
         except Exception as e:
             print(f"❌ {workflow} has invalid YAML: {e}")
             return False
@@ -156,8 +197,7 @@ def test_data_structure():
 
     # Test applications.json structure
     try:
-        with open('website/data/applications.json', 'r') as f:
-            apps_data = json.load(f)
+        apps_data = _load_json('website/data/applications.json')
 
         required_keys = ['metadata', 'applications']
         for key in required_keys:
@@ -179,8 +219,7 @@ def test_data_structure():
 
     # Test categories.json structure
     try:
-        with open('website/data/categories.json', 'r') as f:
-            cats_data = json.load(f)
+        cats_data = _load_json('website/data/categories.json')
 
         if 'categories' not in cats_data:
             print("❌ categories.json missing 'categories' key")
@@ -209,14 +248,58 @@ def test_directory_structure():
         'docs'
     ]
 
+    by_parent = {}
     for directory in required_dirs:
-        if not Path(directory).is_dir():
-            print(f"❌ Missing directory: {directory}")
-            return False
+        path = Path(directory)
+        by_parent.setdefault(path.parent, []).append(path)
+
+    for parent, paths in by_parent.items():
+        try:
+            present = {entry.name for entry in os.scandir(parent) if entry.is_dir()}
+        except OSError:
+            present = set()
+        for path in paths:
+            if path.name not in present:
+                print(f"❌ Missing directory: {path}")
+                return False
 
     print("✅ All required directories present")
     return True
 
+class _ThreadLocalStdout:
+    """Route print output to a per-thread buffer
+
+    Lets independent tests run concurrently while their output is
+    collected per test and replayed in submission order, so the log
+    reads the same as the old sequential run.
+    """
+
+    def __init__(self, fallback):
+        self._fallback = fallback
+        self._local = threading.local()
+
+    def register(self, buffer):
+        self._local.buffer = buffer
+
+    def write(self, text):
+        getattr(self._local, 'buffer', self._fallback).write(text)
+
+    def flush(self):
+        getattr(self._local, 'buffer', self._fallback).flush()
+
+def _run_buffered(test, proxy):
+    """Run one test with its output captured; never raises"""
+    buffer = io.StringIO()
+    proxy.register(buffer)
+    try:
+        result = test()
+        if not result:
+            print("Test failed!")
+    except Exception as e:
+        result = False
+        print(f"Test error: {e}")
+    return result, buffer.getvalue()
+
 def main():
     """Run all verification tests"""
     print("AppBinHub System Verification")
@@ -235,15 +318,23 @@ def main():
     passed = 0
     total = len(tests)
 
-    for test in tests:
+    # The tests are independent and I/O-bound (stat calls, JSON and
+    # YAML parsing, imports), so run them all concurrently and replay
+    # their buffered output in order
+    proxy = _ThreadLocalStdout(sys.stdout)
+    original_stdout = sys.stdout
+    sys.stdout = proxy
+    try:
+        with ThreadPoolExecutor(max_workers=total) as executor:
+            outcomes = list(executor.map(lambda t: _run_buffered(t, proxy), tests))
+    finally:
+        sys.stdout = original_stdout
+
+    for result, output in outcomes:
         print()
-        try:
-            if test():
-                passed += 1
-            else:
-                print("Test failed!")
-        except Exception as e:
-            print(f"Test error: {e}")
+        print(output, end='')
+        if result:
+            passed += 1
 
     print()
     print("=" * 40)